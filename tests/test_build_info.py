@@ -0,0 +1,127 @@
+import pickle
+from pathlib import Path
+
+import orjson
+import pytest
+from intervaltree import Interval
+
+from wake.compiler.build_data_model import (
+    CompilationUnitBuildInfo,
+    ProjectBuild,
+    ProjectBuildInfo,
+    SourceUnitInfo,
+    SourceUnitsInfo,
+)
+from wake.compiler.solc_frontend import SolcInputSettings, SolcOutputError
+from wake.core.solidity_version import SolidityVersion
+from wake.ir.reference_resolver import ReferenceResolver
+from wake.utils.interval_index import FrozenIntervalIndex
+
+
+def _roundtrip(info: ProjectBuildInfo) -> ProjectBuildInfo:
+    return ProjectBuildInfo.from_dict(orjson.loads(orjson.dumps(info.to_dict())))
+
+
+def _build_info(source_units_info: SourceUnitsInfo) -> ProjectBuildInfo:
+    return ProjectBuildInfo(
+        compilation_units={
+            "ab"
+            * 16: CompilationUnitBuildInfo(
+                errors=[
+                    SolcOutputError.model_validate(
+                        {
+                            "type": "Warning",
+                            "component": "general",
+                            "severity": "warning",
+                            "errorCode": "1878",
+                            "message": "SPDX license identifier not provided",
+                        }
+                    )
+                ]
+            )
+        },
+        source_units_info=source_units_info,
+        allow_paths=frozenset([Path("/a"), Path("/b")]),
+        exclude_paths=frozenset([Path("/c")]),
+        include_paths=frozenset(),
+        settings=SolcInputSettings(),
+        target_solidity_version=SolidityVersion.fromstring("0.8.20"),
+        wake_version="4.0.0",
+        incremental=True,
+        hash_algo="xxh3_128",
+    )
+
+
+def test_build_info_roundtrip():
+    infos = {
+        "contracts/A.sol": SourceUnitInfo(
+            Path("/project/contracts/A.sol"),
+            bytes(range(16)),
+            1234,
+            1700000000000000000,
+        ),
+        # sources not read from disk have no size and mtime
+        "contracts/B.sol": SourceUnitInfo(
+            Path("/project/contracts/B.sol"), b"\xff" * 16
+        ),
+    }
+    info = _build_info(SourceUnitsInfo.from_infos(infos))
+    loaded = _roundtrip(info)
+
+    assert dict(loaded.source_units_info) == infos
+    assert loaded.source_units_info["contracts/B.sol"].size is None
+    assert loaded.source_units_info["contracts/B.sol"].mtime_ns is None
+    assert loaded.source_units_info.content_hash_matches(
+        "contracts/A.sol", bytes(range(16))
+    )
+    assert not loaded.source_units_info.content_hash_matches(
+        "contracts/C.sol", bytes(range(16))
+    )
+    assert loaded.compilation_units == info.compilation_units
+    assert loaded.allow_paths == info.allow_paths
+    assert loaded.exclude_paths == info.exclude_paths
+    assert loaded.include_paths == info.include_paths
+    assert loaded.settings == info.settings
+    assert loaded.target_solidity_version == info.target_solidity_version
+    assert loaded.hash_algo == "xxh3_128"
+    assert loaded.to_dict() == info.to_dict()
+
+
+def test_build_info_empty_source_units():
+    loaded = _roundtrip(_build_info(SourceUnitsInfo.from_infos({})))
+    assert len(loaded.source_units_info) == 0
+    assert dict(loaded.source_units_info) == {}
+    assert not loaded.source_units_info.content_hash_matches("A.sol", b"")
+
+
+def test_build_info_old_format_rejected():
+    data = _build_info(SourceUnitsInfo.from_infos({})).to_dict()
+    del data["hash_algo"]
+    data["source_units_info"] = {
+        "A.sol": {"fs_path": "/project/A.sol", "blake2b_hash": "00" * 32}
+    }
+    with pytest.raises(ValueError):
+        ProjectBuildInfo.from_dict(data)
+
+    data = _build_info(SourceUnitsInfo.from_infos({})).to_dict()
+    data["hash_algo"] = "sha256"
+    with pytest.raises(ValueError):
+        ProjectBuildInfo.from_dict(data)
+
+
+def test_project_build_pickle():
+    path = Path("/project/contracts/A.sol")
+    build = ProjectBuild(
+        {path: FrozenIntervalIndex([Interval(0, 10, 1), Interval(2, 5, 2)])},
+        ReferenceResolver(),
+        {},
+    )
+    loaded = pickle.loads(pickle.dumps(build))
+
+    assert set(loaded.interval_trees) == {path}
+    assert loaded.interval_trees[path].at(3) == build.interval_trees[path].at(3)
+    assert len(loaded.source_units) == 0
+
+    # views must reflect in-place changes made by the compiler
+    loaded._interval_trees.pop(path)
+    assert path not in loaded.interval_trees
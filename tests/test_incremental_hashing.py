@@ -0,0 +1,121 @@
+import os
+from pathlib import Path
+
+import networkx as nx
+import pytest
+
+from wake.compiler import SolidityCompiler
+from wake.compiler.build_data_model import (
+    ProjectBuildInfo,
+    SourceUnitInfo,
+    SourceUnitsInfo,
+)
+from wake.compiler.solc_frontend import SolcInputSettings
+from wake.config import WakeConfig
+from wake.utils.hashing import CONTENT_HASH_ALGO, CONTENT_HASH_SIZE, content_hash
+
+SOURCE = b"// SPDX-License-Identifier: MIT\npragma solidity ^0.8.0;\ncontract A {}\n"
+# distinguishes a reused hash from a freshly computed one
+STORED_HASH = b"\xaa" * CONTENT_HASH_SIZE
+
+
+@pytest.fixture()
+def compiler(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config"))
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "data"))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    config = WakeConfig.fromdict({}, project_root_path=tmp_path)
+    return SolidityCompiler(config)
+
+
+def _remember_build(
+    compiler: SolidityCompiler,
+    graph: nx.DiGraph,
+    fs_path=None,
+    hash_algo=CONTENT_HASH_ALGO,
+):
+    # emulate build info stored by a previous compilation
+    compiler._latest_build_info = ProjectBuildInfo(
+        compilation_units={},
+        source_units_info=SourceUnitsInfo.from_infos(
+            {
+                node: SourceUnitInfo(
+                    fs_path if fs_path is not None else graph.nodes[node]["path"],
+                    STORED_HASH,
+                    graph.nodes[node]["size"],
+                    graph.nodes[node]["mtime_ns"],
+                )
+                for node in graph.nodes
+            }
+        ),
+        allow_paths=frozenset(),
+        exclude_paths=frozenset(),
+        include_paths=frozenset(),
+        settings=SolcInputSettings(),
+        target_solidity_version=None,
+        wake_version="0.0.0",
+        incremental=True,
+        hash_algo=hash_algo,
+    )
+
+
+def _hash(compiler: SolidityCompiler, file: Path) -> bytes:
+    graph, _ = compiler.build_graph([file], {})
+    assert graph.number_of_nodes() == 1
+    return next(iter(graph.nodes.values()))["hash"]
+
+
+def _setup(compiler: SolidityCompiler, tmp_path: Path, **kwargs) -> Path:
+    file = tmp_path / "A.sol"
+    file.write_bytes(SOURCE)
+    graph, _ = compiler.build_graph([file], {})
+    node = next(iter(graph.nodes.values()))
+    assert node["hash"] == content_hash(SOURCE)
+    assert node["size"] == len(SOURCE)
+    assert node["mtime_ns"] == file.stat().st_mtime_ns
+    _remember_build(compiler, graph, **kwargs)
+    return file
+
+
+def test_hash_reused_when_unchanged(compiler: SolidityCompiler, tmp_path: Path):
+    file = _setup(compiler, tmp_path)
+    assert _hash(compiler, file) == STORED_HASH
+
+
+def test_hash_recomputed_when_mtime_changed(compiler: SolidityCompiler, tmp_path: Path):
+    file = _setup(compiler, tmp_path)
+    st = file.stat()
+    os.utime(file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert _hash(compiler, file) == content_hash(SOURCE)
+
+
+def test_hash_recomputed_when_size_changed(compiler: SolidityCompiler, tmp_path: Path):
+    file = _setup(compiler, tmp_path)
+    st = file.stat()
+    new_source = SOURCE + b"contract B {}\n"
+    file.write_bytes(new_source)
+    # keep the original modification time so that only the size differs
+    os.utime(file, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert _hash(compiler, file) == content_hash(new_source)
+
+
+def test_hash_recomputed_when_path_changed(compiler: SolidityCompiler, tmp_path: Path):
+    file = _setup(compiler, tmp_path, fs_path=tmp_path / "B.sol")
+    assert _hash(compiler, file) == content_hash(SOURCE)
+
+
+def test_hash_recomputed_when_hash_algo_changed(
+    compiler: SolidityCompiler, tmp_path: Path
+):
+    other_algo = "blake2b" if CONTENT_HASH_ALGO == "xxh3_128" else "xxh3_128"
+    file = _setup(compiler, tmp_path, hash_algo=other_algo)
+    assert _hash(compiler, file) == content_hash(SOURCE)
+
+
+def test_hash_recomputed_for_modified_content(
+    compiler: SolidityCompiler, tmp_path: Path
+):
+    file = _setup(compiler, tmp_path)
+    new_source = SOURCE + b"contract B {}\n"
+    graph, _ = compiler.build_graph([file], {file: new_source})
+    assert next(iter(graph.nodes.values()))["hash"] == content_hash(new_source)
@@ -0,0 +1,80 @@
+import pickle
+import random
+
+from intervaltree import Interval, IntervalTree
+
+from wake.utils.interval_index import FrozenIntervalIndex
+
+
+def _random_intervals(rnd: random.Random, count: int, size: int):
+    intervals = set()
+    # nested intervals covering the whole range, similar to AST nodes
+    intervals.add(Interval(0, size, -1))
+    for i in range(count):
+        begin = rnd.randrange(size)
+        end = rnd.randrange(begin + 1, min(begin + 50, size) + 1)
+        intervals.add(Interval(begin, end, i))
+    return intervals
+
+
+def _check_equal(
+    index: FrozenIntervalIndex, tree: IntervalTree, size: int, rnd: random.Random
+):
+    assert len(index) == len(tree)
+    assert set(index) == tree.items()
+    assert index.items() == tree.items()
+    assert index.is_empty() == tree.is_empty()
+    if not tree.is_empty():
+        assert index.begin() == tree.begin()
+        assert index.end() == tree.end()
+
+    for p in range(-2, size + 2):
+        assert index.at(p) == tree.at(p)
+        assert index[p] == tree[p]
+
+    for _ in range(300):
+        begin = rnd.randrange(-2, size + 2)
+        end = rnd.randrange(-2, size + 2)
+        assert index.overlap(begin, end) == tree.overlap(begin, end)
+        assert index.envelop(begin, end) == tree.envelop(begin, end)
+        assert index[begin:end] == tree[begin:end]
+
+    assert index[:] == tree[:]
+    assert index[size // 2 :] == tree[size // 2 :]
+    assert index[: size // 2] == tree[: size // 2]
+
+    for interval in tree:
+        assert interval in index
+        assert index.overlap(interval) == tree.overlap(interval)
+        assert index.envelop(interval) == tree.envelop(interval)
+    assert Interval(0, size + 1, -1) not in index
+
+
+def test_interval_index_random():
+    rnd = random.Random(0)
+    for count, size in [(1, 5), (10, 20), (100, 100), (500, 1000)]:
+        intervals = _random_intervals(rnd, count, size)
+        _check_equal(FrozenIntervalIndex(intervals), IntervalTree(intervals), size, rnd)
+
+
+def test_interval_index_empty():
+    index = FrozenIntervalIndex()
+    assert len(index) == 0
+    assert index.is_empty()
+    assert index.at(0) == set()
+    assert index[0] == set()
+    assert index[:] == set()
+    assert index.overlap(0, 10) == set()
+    assert index.envelop(0, 10) == set()
+    assert Interval(0, 1) not in index
+
+
+def test_interval_index_pickle():
+    rnd = random.Random(1)
+    intervals = _random_intervals(rnd, 100, 200)
+    index = FrozenIntervalIndex(intervals)
+    unpickled = pickle.loads(pickle.dumps(index))
+    _check_equal(unpickled, IntervalTree(intervals), 200, rnd)
+
+    empty = pickle.loads(pickle.dumps(FrozenIntervalIndex()))
+    assert empty.is_empty()
@@ -0,0 +1,50 @@
+import json
+
+import pytest
+
+from wake.development.json_rpc.serialization import decode, encode
+
+BIG_VALUES = [
+    2**64 - 1,
+    2**64,
+    10**21,
+    2**256 - 1,
+    -(2**63),
+    -(2**63) - 1,
+    -(2**255),
+]
+
+
+@pytest.mark.parametrize("value", BIG_VALUES)
+def test_encode_big_int(value):
+    data = {
+        "jsonrpc": "2.0",
+        "method": "eth_signTypedData_v4",
+        "params": ["0x" + "00" * 20, {"message": {"value": value}, "values": [value]}],
+        "id": 1,
+    }
+    encoded = encode(data)
+    assert isinstance(encoded, bytes)
+    assert json.dumps(json.loads(encoded)) == json.dumps(data)
+
+
+@pytest.mark.parametrize("value", BIG_VALUES)
+def test_decode_big_int(value):
+    for payload in [
+        f'{{"jsonrpc":"2.0","id":1,"result":{value}}}',
+        f'{{"result": {{"a": "0x1234", "b": {value}}}}}',
+        f'{{"result":[1,{value}]}}',
+        f'{{"result":[ {value}, 2]}}',
+        f"[{value}]",
+    ]:
+        decoded = decode(payload.encode("utf-8"))
+        # compare serialized forms, floats compare equal to ints of the same value
+        assert json.dumps(decoded) == json.dumps(json.loads(payload))
+
+    assert decode(bytearray(f"[{value}]".encode("utf-8"))) == [value]
+
+
+def test_decode_small_and_string_values():
+    payload = b'{"result":{"hash":"0x00000000000000000000000000000000000000000000","n":123,"f":1.5,"neg":-5}}'
+    assert decode(payload) == json.loads(payload)
+    assert encode(json.loads(payload)) == payload
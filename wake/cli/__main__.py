@@ -1,4 +1,5 @@
 import asyncio
+import importlib
 import logging
 import os
 import platform
@@ -8,19 +9,8 @@ from typing import Any, List, Optional, Sequence
 
 import rich_click as click
 from click.core import Context
-from rich.logging import RichHandler
 
-from .accounts import run_accounts
-from .compile import run_compile
 from .console import console
-from .detect import run_detect
-from .init import run_init
-from .lsp import run_lsp
-from .open import run_open
-from .print import run_print
-from .run import run_run
-from .svm import run_svm
-from .test import run_test
 
 if platform.system() != "Windows":
     try:
@@ -68,13 +58,30 @@ click.rich_click.COMMAND_GROUPS = {
 
 
 class AliasedGroup(click.RichGroup):
+    # sub-commands are imported on demand to keep startup fast
+    lazy_commands = {
+        "accounts": "wake.cli.accounts:run_accounts",
+        "compile": "wake.cli.compile:run_compile",
+        "detect": "wake.cli.detect:run_detect",
+        "lsp": "wake.cli.lsp:run_lsp",
+        "open": "wake.cli.open:run_open",
+        "print": "wake.cli.print:run_print",
+        "run": "wake.cli.run:run_run",
+        "svm": "wake.cli.svm:run_svm",
+        "test": "wake.cli.test:run_test",
+        "up": "wake.cli.init:run_init",
+    }
+
     def get_command(self, ctx: Context, cmd_name: str) -> Optional[click.Command]:
         if cmd_name == "init":
             cmd_name = "up"
+        if cmd_name in self.lazy_commands:
+            module_name, command_name = self.lazy_commands[cmd_name].split(":")
+            return getattr(importlib.import_module(module_name), command_name)
         return super().get_command(ctx, cmd_name)
 
     def list_commands(self, ctx: Context) -> List[str]:
-        return sorted(["up"] + super().list_commands(ctx))
+        return sorted(set(super().list_commands(ctx)) | self.lazy_commands.keys())
 
     def main(
         self,
@@ -139,6 +146,8 @@ class AliasedGroup(click.RichGroup):
 def main(
     ctx: Context, debug: bool, silent: bool, profile: bool, config: Optional[str]
 ) -> None:
+    from rich.logging import RichHandler
+
     from wake.migrations import run_woke_wake_migration, run_xdg_migration
 
     if profile:
@@ -201,18 +210,6 @@ def main(
     run_woke_wake_migration()
 
 
-main.add_command(run_accounts)
-main.add_command(run_compile)
-main.add_command(run_detect)
-main.add_command(run_init)
-main.add_command(run_lsp)
-main.add_command(run_open)
-main.add_command(run_print)
-main.add_command(run_run)
-main.add_command(run_svm)
-main.add_command(run_test)
-
-
 @main.command(name="config")
 @click.pass_context
 def config(ctx: Context) -> None:
@@ -228,10 +225,10 @@ def wake_solc() -> None:
     import subprocess
     import sys
 
+    import orjson
+
     from wake.config import WakeConfig
-    from wake.core.solidity_version import SolidityVersion
     from wake.migrations import run_woke_wake_migration, run_xdg_migration
-    from wake.svm import SolcVersionManager
 
     logging.basicConfig(level=logging.CRITICAL)
 
@@ -241,21 +238,50 @@ def wake_solc() -> None:
     # WARNING: this config instance does not accept local config path
     config = WakeConfig()
     config.load_configs()
-    svm = SolcVersionManager(config)
 
     version_file_path = config.global_data_path / "solc-version.txt"
-    if not version_file_path.is_file():
+    try:
+        version_str = version_file_path.read_text()
+    except OSError:
         console.print(
             "Target solc version is not configured. Run 'wake svm use' or 'wake svm switch' command."
         )
         sys.exit(1)
 
-    version = SolidityVersion.fromstring(version_file_path.read_text())
-    solc_path = svm.get_path(version)
+    # reuse the solc path resolved by a previous invocation for the same configured version
+    cache_path = config.global_cache_path / "solc-path.json"
+    solc_path = None
+    try:
+        cache = orjson.loads(cache_path.read_bytes())
+        if cache["version_file"] == version_str and Path(cache["solc_path"]).is_file():
+            solc_path = Path(cache["solc_path"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    if solc_path is None:
+        from wake.core.solidity_version import SolidityVersion
+        from wake.svm import SolcVersionManager
+
+        svm = SolcVersionManager(config)
+        version = SolidityVersion.fromstring(version_str)
+        solc_path = svm.get_path(version)
+
+        if not svm.installed(version):
+            console.print(f"solc version {version} is not installed.")
+            sys.exit(1)
 
-    if not svm.installed(version):
-        console.print(f"solc version {version} is not installed.")
-        sys.exit(1)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_bytes(
+                orjson.dumps(
+                    {
+                        "version_file": version_str,
+                        "solc_path": str(solc_path),
+                    }
+                )
+            )
+        except OSError:
+            pass
 
     proc = subprocess.run(
         [str(solc_path)] + sys.argv[1:],
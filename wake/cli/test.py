@@ -23,6 +23,8 @@ def run_no_pytest(
     coverage: int,
     random_seeds: List[bytes],
     attach_first: bool,
+    rich_traceback: bool,
+    forkserver: bool,
     args: Tuple[str, ...],
 ) -> None:
     import importlib.util
@@ -132,6 +134,8 @@ def run_no_pytest(
                     attach_first,
                     coverage,
                     False,
+                    rich_traceback,
+                    forkserver,
                 )
         except Exception as e:
             console.print_exception()
@@ -209,6 +213,18 @@ class FileAndPassParamType(click.ParamType):
     default=False,
     help="In multi-process mode, print stdout of first process to console and don't prompt on exception in other processes.",
 )
+@click.option(
+    "--rich-traceback",
+    is_flag=True,
+    default=False,
+    help="In --no-pytest multi-process mode, transfer whole exceptions from processes to print rich tracebacks.",
+)
+@click.option(
+    "--forkserver",
+    is_flag=True,
+    default=False,
+    help="In --no-pytest multi-process mode, start processes from a fork server with the test module preloaded. Test modules must be importable by their names.",
+)
 @click.option(
     "--dist",
     type=click.Choice(["uniform", "duplicated"]),
@@ -233,6 +249,8 @@ def run_test(
     no_pytest: bool,
     seeds: Tuple[str],
     attach_first: bool,
+    rich_traceback: bool,
+    forkserver: bool,
     dist: str,
     verbosity: int,
     paths_or_pytest_args: Tuple[str, ...],
@@ -287,6 +305,8 @@ def run_test(
             coverage,
             random_seeds,
             attach_first,
+            rich_traceback,
+            forkserver,
             paths_or_pytest_args,
         )
     else:
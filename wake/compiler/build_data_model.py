@@ -1,52 +1,52 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from array import array
+from dataclasses import dataclass, field
 from pathlib import Path
 from types import MappingProxyType
-from typing import Any, Dict, FrozenSet, List, Optional
-
-from intervaltree import IntervalTree
-from pydantic import (
-    BaseModel,
-    ConfigDict,
-    Extra,
-    PlainSerializer,
-    PlainValidator,
-    WithJsonSchema,
-    errors,
-    field_serializer,
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
 )
-from typing_extensions import Annotated
+
+from typing_extensions import Literal
 
 from wake.compiler.solc_frontend import SolcInputSettings, SolcOutputError
 from wake.core.solidity_version import SolidityVersion
 from wake.ir import SourceUnit
 from wake.ir.reference_resolver import ReferenceResolver
+from wake.utils.interval_index import FrozenIntervalIndex
 
+T = TypeVar("T", bound="SerializableDataclass")
 
-def hex_bytes_validator(val: Any) -> bytes:
-    if isinstance(val, bytes):
-        return val
-    elif isinstance(val, bytearray):
-        return bytes(val)
-    elif isinstance(val, str):
-        return bytes.fromhex(val)
-    raise errors.BytesError()
 
+class SerializableDataclass(ABC):
+    """
+    Base class for build info dataclasses serialized to and from JSON-compatible dicts.
+    """
 
-HexBytes = Annotated[
-    bytes,
-    PlainValidator(hex_bytes_validator),
-    PlainSerializer(lambda b: b.hex()),
-    WithJsonSchema({"type": "string"}),
-]
-
+    @abstractmethod
+    def to_dict(self) -> Dict[str, Any]:
+        ...
 
-class BuildInfoModel(BaseModel):
-    model_config = ConfigDict(
-        extra=Extra.allow,
-        frozen=True,
-    )
+    @classmethod
+    @abstractmethod
+    def from_dict(cls: Type[T], data: Dict[str, Any]) -> T:
+        ...
 
 
-class CompilationUnitBuildInfo(BuildInfoModel):
+@dataclass(frozen=True)
+class CompilationUnitBuildInfo(SerializableDataclass):
     """
     Holds all compilation errors and warnings that occurred during compilation of a single compilation unit.
     Some errors and warnings may not be associated with any specific source code location.
@@ -58,23 +58,163 @@ class CompilationUnitBuildInfo(BuildInfoModel):
 
     errors: List[SolcOutputError]
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "errors": [e.model_dump(mode="json", by_alias=True) for e in self.errors]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> CompilationUnitBuildInfo:
+        return cls(errors=[SolcOutputError.model_validate(e) for e in data["errors"]])
 
-class SourceUnitInfo(BuildInfoModel):
+
+class SourceUnitInfo(NamedTuple):
     """
     Attributes:
         fs_path: Path to the source unit.
-        blake2b_hash: 256-bit blake2b hash of the source unit contents.
+        content_hash: Hash of the source unit contents computed using [ProjectBuildInfo.hash_algo][wake.compiler.build_data_model.ProjectBuildInfo.hash_algo].
+        size: Size of the source unit file in bytes at the time of hashing, if read from disk.
+        mtime_ns: Modification time of the source unit file in nanoseconds at the time of hashing, if read from disk.
     """
 
     fs_path: Path
-    blake2b_hash: HexBytes
+    content_hash: bytes
+    size: Optional[int] = None
+    mtime_ns: Optional[int] = None
+
+
+@dataclass(frozen=True, eq=False)
+class SourceUnitsInfo(SerializableDataclass, Mapping[str, SourceUnitInfo]):
+    """
+    Columnar storage of [SourceUnitInfo][wake.compiler.build_data_model.SourceUnitInfo] entries of all source units in a project build.
+    Behaves as a read-only mapping of source unit names to [SourceUnitInfo][wake.compiler.build_data_model.SourceUnitInfo] items constructed on access.
+
+    Attributes:
+        names: Source unit names.
+        fs_paths: Paths to the source units.
+        hashes: Concatenated fixed-width content hashes of the source units.
+        sizes: Sizes of the source unit files in bytes, `-1` if unknown.
+        mtimes_ns: Modification times of the source unit files in nanoseconds, `-1` if unknown.
+    """
+
+    names: Tuple[str, ...]
+    fs_paths: Tuple[str, ...]
+    hashes: bytes
+    sizes: array
+    mtimes_ns: array
+    _indexes: Dict[str, int] = field(init=False, repr=False)
+    _hash_size: int = field(init=False, repr=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self, "_indexes", {name: i for i, name in enumerate(self.names)}
+        )
+        object.__setattr__(
+            self,
+            "_hash_size",
+            len(self.hashes) // len(self.names) if len(self.names) > 0 else 0,
+        )
+
+    @classmethod
+    def from_infos(cls, infos: Mapping[str, SourceUnitInfo]) -> SourceUnitsInfo:
+        hashes = b"".join(info.content_hash for info in infos.values())
+        if len(infos) > 0 and len(hashes) != len(infos) * len(
+            next(iter(infos.values())).content_hash
+        ):
+            raise ValueError("Source unit hashes must be of the same size")
 
+        return cls(
+            names=tuple(infos.keys()),
+            fs_paths=tuple(str(info.fs_path) for info in infos.values()),
+            hashes=hashes,
+            sizes=array(
+                "q",
+                (info.size if info.size is not None else -1 for info in infos.values()),
+            ),
+            mtimes_ns=array(
+                "q",
+                (
+                    info.mtime_ns if info.mtime_ns is not None else -1
+                    for info in infos.values()
+                ),
+            ),
+        )
 
-class ProjectBuildInfo(BuildInfoModel):
+    def to_dict(self) -> Dict[str, Any]:
+        hex_hashes = self.hashes.hex()
+        hex_size = 2 * self._hash_size
+        return {
+            name: {
+                "fs_path": self.fs_paths[i],
+                "content_hash": hex_hashes[i * hex_size : (i + 1) * hex_size],
+                "size": self.sizes[i] if self.sizes[i] >= 0 else None,
+                "mtime_ns": self.mtimes_ns[i] if self.mtimes_ns[i] >= 0 else None,
+            }
+            for i, name in enumerate(self.names)
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> SourceUnitsInfo:
+        infos = list(data.values())
+        try:
+            hex_hashes = [info["content_hash"] for info in infos]
+        except KeyError:
+            # e.g. build info written before the blake2b_hash -> content_hash rename
+            raise ValueError("Unsupported source units info format") from None
+        if len(set(map(len, hex_hashes))) > 1:
+            raise ValueError("Source unit hashes must be of the same size")
+
+        sizes = (info.get("size") for info in infos)
+        mtimes_ns = (info.get("mtime_ns") for info in infos)
+        return cls(
+            names=tuple(data.keys()),
+            fs_paths=tuple(info["fs_path"] for info in infos),
+            # decode all hashes at once instead of one bytes object per source unit
+            hashes=bytes.fromhex("".join(hex_hashes)),
+            sizes=array("q", (size if size is not None else -1 for size in sizes)),
+            mtimes_ns=array(
+                "q", (mtime if mtime is not None else -1 for mtime in mtimes_ns)
+            ),
+        )
+
+    def __getitem__(self, name: str) -> SourceUnitInfo:
+        i = self._indexes[name]
+        size = self.sizes[i]
+        mtime_ns = self.mtimes_ns[i]
+        return SourceUnitInfo(
+            Path(self.fs_paths[i]),
+            self.hashes[i * self._hash_size : (i + 1) * self._hash_size],
+            size if size >= 0 else None,
+            mtime_ns if mtime_ns >= 0 else None,
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._indexes
+
+    def content_hash_matches(self, name: str, content_hash: bytes) -> bool:
+        """
+        Returns:
+            True if the source unit is present and its content hash equals the given hash, False otherwise.
+        """
+        i = self._indexes.get(name)
+        if i is None:
+            return False
+        view = memoryview(self.hashes)
+        return view[i * self._hash_size : (i + 1) * self._hash_size] == content_hash
+
+
+@dataclass(frozen=True)
+class ProjectBuildInfo(SerializableDataclass):
     """
     Attributes:
         compilation_units: Mapping of compilation unit hex-encoded hashes to compilation unit build info.
-        source_units_info: Mapping of source unit names to source unit info.
+        source_units_info: Mapping of source unit names to source unit info, stored in a columnar layout.
         allow_paths: Compilation [allow_paths][wake.config.data_model.SolcConfig.allow_paths] used during compilation.
         exclude_paths: Compilation [exclude_paths][wake.config.data_model.SolcConfig.exclude_paths] used during compilation.
         include_paths: Compilation [include_paths][wake.config.data_model.SolcConfig.include_paths] used during compilation.
@@ -82,10 +222,11 @@ class ProjectBuildInfo(BuildInfoModel):
         target_solidity_version: Solidity [target_version][wake.config.data_model.SolcConfig.target_version] used during compilation, if any.
         wake_version: `eth-wake` version used during compilation.
         incremental: Whether the compilation was performed in incremental mode.
+        hash_algo: Hash algorithm used to compute [SourceUnitInfo.content_hash][wake.compiler.build_data_model.SourceUnitInfo.content_hash].
     """
 
     compilation_units: Dict[str, CompilationUnitBuildInfo]
-    source_units_info: Dict[str, SourceUnitInfo]
+    source_units_info: SourceUnitsInfo
     allow_paths: FrozenSet[Path]
     exclude_paths: FrozenSet[Path]
     include_paths: FrozenSet[Path]
@@ -93,10 +234,52 @@ class ProjectBuildInfo(BuildInfoModel):
     target_solidity_version: Optional[SolidityVersion]
     wake_version: str
     incremental: bool
+    hash_algo: Literal["blake2b", "xxh3_128"] = "blake2b"
 
-    @field_serializer("target_solidity_version", when_used="json")
-    def serialize_target_version(self, version: Optional[SolidityVersion], info):
-        return str(version) if version is not None else None
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "compilation_units": {
+                cu_hash: info.to_dict()
+                for cu_hash, info in self.compilation_units.items()
+            },
+            "source_units_info": self.source_units_info.to_dict(),
+            "allow_paths": sorted(str(p) for p in self.allow_paths),
+            "exclude_paths": sorted(str(p) for p in self.exclude_paths),
+            "include_paths": sorted(str(p) for p in self.include_paths),
+            "settings": self.settings.model_dump(mode="json", by_alias=True),
+            "target_solidity_version": str(self.target_solidity_version)
+            if self.target_solidity_version is not None
+            else None,
+            "wake_version": self.wake_version,
+            "incremental": self.incremental,
+            "hash_algo": self.hash_algo,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> ProjectBuildInfo:
+        hash_algo = data.get("hash_algo", "blake2b")
+        if hash_algo not in {"blake2b", "xxh3_128"}:
+            raise ValueError(f"Unknown hash algorithm {hash_algo}")
+
+        return cls(
+            compilation_units={
+                cu_hash: CompilationUnitBuildInfo.from_dict(info)
+                for cu_hash, info in data["compilation_units"].items()
+            },
+            source_units_info=SourceUnitsInfo.from_dict(data["source_units_info"]),
+            allow_paths=frozenset(Path(p) for p in data["allow_paths"]),
+            exclude_paths=frozenset(Path(p) for p in data["exclude_paths"]),
+            include_paths=frozenset(Path(p) for p in data["include_paths"]),
+            settings=SolcInputSettings.model_validate(data["settings"]),
+            target_solidity_version=SolidityVersion.fromstring(
+                data["target_solidity_version"]
+            )
+            if data["target_solidity_version"] is not None
+            else None,
+            wake_version=data["wake_version"],
+            incremental=data["incremental"],
+            hash_algo=hash_algo,
+        )
 
 
 class ProjectBuild:
@@ -104,29 +287,45 @@ class ProjectBuild:
     Class holding a single project build.
     """
 
-    _interval_trees: Dict[Path, IntervalTree]
+    _interval_trees: Dict[Path, FrozenIntervalIndex]
+    _interval_trees_view: Mapping[Path, FrozenIntervalIndex]
     _reference_resolver: ReferenceResolver
     _source_units: Dict[Path, SourceUnit]
+    _source_units_view: Mapping[Path, SourceUnit]
 
     def __init__(
         self,
-        interval_trees: Dict[Path, IntervalTree],
+        interval_trees: Dict[Path, FrozenIntervalIndex],
         reference_resolver: ReferenceResolver,
         source_units: Dict[Path, SourceUnit],
     ):
         self._interval_trees = interval_trees
         self._reference_resolver = reference_resolver
         self._source_units = source_units
+        # read-only views reflect later in-place changes of the underlying dicts made by the compiler
+        self._interval_trees_view = MappingProxyType(interval_trees)
+        self._source_units_view = MappingProxyType(source_units)
+
+    def __getstate__(self):
+        # mapping proxies cannot be pickled
+        state = self.__dict__.copy()
+        del state["_interval_trees_view"]
+        del state["_source_units_view"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._interval_trees_view = MappingProxyType(self._interval_trees)
+        self._source_units_view = MappingProxyType(self._source_units)
 
     @property
-    def interval_trees(self) -> Dict[Path, IntervalTree]:
+    def interval_trees(self) -> Dict[Path, FrozenIntervalIndex]:
         """
         Returns:
-            Mapping of source file paths to [interval trees](https://github.com/chaimleib/intervaltree) that can be used to query IR nodes by byte offsets in the source code.
+            Mapping of source file paths to read-only interval indexes that can be used to query IR nodes by byte offsets in the source code.
+                The indexes support the query API of [interval trees](https://github.com/chaimleib/intervaltree) (`at`, `overlap`, `envelop` and indexing/slicing).
         """
-        return MappingProxyType(
-            self._interval_trees
-        )  # pyright: ignore reportGeneralTypeIssues
+        return self._interval_trees_view  # pyright: ignore reportGeneralTypeIssues
 
     @property
     def reference_resolver(self) -> ReferenceResolver:
@@ -142,6 +341,4 @@ class ProjectBuild:
         Returns:
             Mapping of source file paths to top-level [SourceUnit][wake.ir.meta.source_unit.SourceUnit] IR nodes.
         """
-        return MappingProxyType(
-            self._source_units
-        )  # pyright: ignore reportGeneralTypeIssues
+        return self._source_units_view  # pyright: ignore reportGeneralTypeIssues
@@ -3,11 +3,11 @@ from pathlib import Path
 from typing import DefaultDict, FrozenSet, Iterable, Set
 
 import networkx as nx
-from Crypto.Hash import BLAKE2b
 
 from wake.compiler.source_path_resolver import SourcePathResolver
 from wake.config import WakeConfig
 from wake.core.solidity_version import SolidityVersionRanges
+from wake.utils.hashing import CONTENT_HASH_SIZE, content_hash
 
 # pyright: reportGeneralTypeIssues=false
 
@@ -23,11 +23,10 @@ class CompilationUnit:
         self.__version_ranges = version_ranges
         self.__paths_to_source_unit_names = defaultdict(set)
 
-        self.__hash = bytes([0] * 32)
+        # all hashes must be of the same size, zip would silently truncate the result otherwise
+        self.__hash = bytes(CONTENT_HASH_SIZE)
         for node in unit_graph.nodes:
-            source_unit_name_hash = BLAKE2b.new(
-                data=str(node).encode("utf-8"), digest_bits=256
-            ).digest()
+            source_unit_name_hash = content_hash(str(node).encode("utf-8"))
             self.__hash = bytes(
                 a ^ b ^ c
                 for a, b, c in zip(
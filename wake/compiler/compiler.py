@@ -28,6 +28,7 @@ from typing import (
 )
 
 import networkx as nx
+import orjson
 import rich
 import rich.console
 import rich.panel
@@ -70,12 +71,15 @@ from wake.svm import SolcVersionManager
 
 from ..utils import get_package_version
 from ..utils.file_utils import is_relative_to
+from ..utils.hashing import CONTENT_HASH_ALGO
+from ..utils.interval_index import FrozenIntervalIndex
 from ..utils.keyed_default_dict import KeyedDefaultDict
 from .build_data_model import (
     CompilationUnitBuildInfo,
     ProjectBuild,
     ProjectBuildInfo,
     SourceUnitInfo,
+    SourceUnitsInfo,
 )
 from .compilation_unit import CompilationUnit
 from .exceptions import CompilationError, CompilationResolveError
@@ -376,6 +380,25 @@ class SolidityCompiler:
                 )
         return prepared
 
+    def _get_cached_hash(
+        self, source_unit_name: str, path: Path, size: int, mtime_ns: int
+    ) -> Optional[bytes]:
+        # reuse the hash from the previous build if the file size and modification time did not change
+        if (
+            self._latest_build_info is None
+            or self._latest_build_info.hash_algo != CONTENT_HASH_ALGO
+        ):
+            return None
+        info = self._latest_build_info.source_units_info.get(source_unit_name)
+        if (
+            info is None
+            or info.fs_path != path
+            or info.size != size
+            or info.mtime_ns != mtime_ns
+        ):
+            return None
+        return info.content_hash
+
     def build_graph(
         self,
         files: Iterable[Path],
@@ -418,15 +441,24 @@ class SolidityCompiler:
         # recursively process all sources
         while len(source_units_queue) > 0:
             source_unit_name, path, content = source_units_queue.pop()
+            size = None
+            mtime_ns = None
             if content is None:
                 try:
+                    stat = path.stat()
+                    size = stat.st_size
+                    mtime_ns = stat.st_mtime_ns
                     (
                         versions,
                         imports,
                         h,
                         content,
                         wake_comments,
-                    ) = SoliditySourceParser.parse(path, ignore_errors)
+                    ) = SoliditySourceParser.parse(
+                        path,
+                        ignore_errors,
+                        self._get_cached_hash(source_unit_name, path, size, mtime_ns),
+                    )
                 except UnicodeDecodeError:
                     continue
             else:
@@ -438,6 +470,8 @@ class SolidityCompiler:
                 path=path,
                 versions=versions,
                 hash=h,
+                size=size,
+                mtime_ns=mtime_ns,
                 content=content,
                 unresolved_imports=set(),
                 wake_comments=self._prepare_wake_comments(path, content, wake_comments),
@@ -702,8 +736,8 @@ class SolidityCompiler:
         with ctx_manager:
             try:
                 latest_build_path = self.__config.project_root_path / ".wake" / "build"
-                build_info = ProjectBuildInfo.parse_file(
-                    latest_build_path / "build.json"
+                build_info = ProjectBuildInfo.from_dict(
+                    orjson.loads((latest_build_path / "build.json").read_bytes())
                 )
                 build_data = (latest_build_path / "build.bin").read_bytes()
 
@@ -738,6 +772,8 @@ class SolidityCompiler:
                 self._latest_build_info = build_info
             except (
                 AttributeError,
+                KeyError,
+                TypeError,
                 ModuleNotFoundError,
                 ValidationError,
                 JSONDecodeError,
@@ -863,6 +899,7 @@ class SolidityCompiler:
                 or self._latest_build_info.target_solidity_version
                 != self.__config.compiler.solc.target_version
                 or self._latest_build_info.incremental != incremental
+                or self._latest_build_info.hash_algo != CONTENT_HASH_ALGO
             ):
                 logger.debug("Build settings changed")
                 build_settings_changed = True
@@ -894,19 +931,18 @@ class SolidityCompiler:
             # files_to_compile = set(modified_files.keys())
             files_to_compile = set()
 
+            latest_source_units_info = self._latest_build_info.source_units_info
             for source_unit in graph.nodes:
-                if (
-                    source_unit not in self._latest_build_info.source_units_info
-                    or self._latest_build_info.source_units_info[
-                        source_unit
-                    ].blake2b_hash
-                    != graph.nodes[source_unit]["hash"]
+                if not latest_source_units_info.content_hash_matches(
+                    source_unit, graph.nodes[source_unit]["hash"]
                 ):
                     files_to_compile.add(source_units_to_paths[source_unit])
 
-            for source_unit, info in self._latest_build_info.source_units_info.items():
+            for source_unit, fs_path in zip(
+                latest_source_units_info.names, latest_source_units_info.fs_paths
+            ):
                 if source_unit not in graph.nodes:
-                    deleted_files.add(info.fs_path)
+                    deleted_files.add(Path(fs_path))
 
             if not incremental:
                 compilation_units = self.merge_compilation_units(
@@ -1065,7 +1101,9 @@ class SolidityCompiler:
             source_units_info = {
                 str(source_unit): SourceUnitInfo(
                     fs_path=graph.nodes[source_unit]["path"],
-                    blake2b_hash=graph.nodes[source_unit]["hash"],
+                    content_hash=graph.nodes[source_unit]["hash"],
+                    size=graph.nodes[source_unit]["size"],
+                    mtime_ns=graph.nodes[source_unit]["mtime_ns"],
                 )
                 for source_unit in graph.nodes
                 if graph.nodes[source_unit]["path"] not in deleted_files
@@ -1082,7 +1120,9 @@ class SolidityCompiler:
                 for source_unit_name, raw_ast in solc_output.sources.items():
                     source_units_info[source_unit_name] = SourceUnitInfo(
                         fs_path=graph.nodes[source_unit_name]["path"],
-                        blake2b_hash=graph.nodes[source_unit_name]["hash"],
+                        content_hash=graph.nodes[source_unit_name]["hash"],
+                        size=graph.nodes[source_unit_name]["size"],
+                        mtime_ns=graph.nodes[source_unit_name]["mtime_ns"],
                     )
 
                     path = cu.source_unit_name_to_path(source_unit_name)
@@ -1114,7 +1154,7 @@ class SolidityCompiler:
                         else None,
                     )
                     build._source_units[path] = SourceUnit(init, ast)
-                    build._interval_trees[path] = interval_tree
+                    build._interval_trees[path] = FrozenIntervalIndex(interval_tree)
 
                 build.reference_resolver.run_post_process_callbacks(
                     CallbackParams(
@@ -1186,10 +1226,11 @@ class SolidityCompiler:
             exclude_paths=self.__config.compiler.solc.exclude_paths,
             include_paths=self.__config.compiler.solc.include_paths,
             settings=build_settings,
-            source_units_info=source_units_info,
+            source_units_info=SourceUnitsInfo.from_infos(source_units_info),
             target_solidity_version=self.__config.compiler.solc.target_version,
             wake_version=get_package_version("eth-wake"),
             incremental=incremental,
+            hash_algo=CONTENT_HASH_ALGO,
         )
         self._latest_build = build
 
@@ -1285,8 +1326,8 @@ class SolidityCompiler:
             build_path = self.__config.project_root_path / ".wake" / "build"
             build_path.mkdir(parents=True, exist_ok=True)
 
-            with (build_path / "build.json").open("w") as f:
-                f.write(self._latest_build_info.model_dump_json(by_alias=True))
+            with (build_path / "build.json").open("wb") as f:
+                f.write(orjson.dumps(self._latest_build_info.to_dict()))
 
             with (build_path / "build.bin").open("wb") as data_file, (
                 build_path / "build.bin.sig"
@@ -215,7 +215,9 @@ class Visitor:
 
             - `path`: [Path][pathlib.Path] to the source unit file.
             - `versions`: [SolidityVersionRanges][wake.core.solidity_version.SolidityVersionRanges] describing allowed Solidity versions by pragma directives.
-            - `hash`: [bytes][bytes] 256-bit BLAKE2b hash of the source unit file contents.
+            - `hash`: [bytes][bytes] hash of the source unit file contents (128-bit xxh3, or 256-bit BLAKE2b if `xxhash` is not installed).
+            - `size`: [int][int] source unit file size in bytes, or `None` if the contents were not read from disk.
+            - `mtime_ns`: [int][int] source unit file modification time in nanoseconds, or `None` if the contents were not read from disk.
             - `content`: [bytes][bytes] source unit file contents.
 
             !!! warning
@@ -195,6 +195,7 @@ class ChainInterfaceAbc(ABC):
 
         try:
             start = time.perf_counter()
+            delay = 0.01
             while True:
                 try:
                     comm = JsonRpcCommunicator(config, f"ws://{hostname}:{port}")
@@ -202,9 +203,15 @@ class ChainInterfaceAbc(ABC):
                     comm.send_request("web3_clientVersion").lower()
                     break
                 except (ConnectionRefusedError, URLError, ValueError):
+                    # do not wait for the timeout if the process failed to start
+                    if process.poll() is not None:
+                        raise RuntimeError(
+                            f"{args[0]} exited with code {process.returncode} before accepting connections"
+                        )
                     if time.perf_counter() - start > config.general.json_rpc_timeout:
                         raise
-                    time.sleep(0.05)
+                    time.sleep(delay)
+                    delay = min(delay * 2, 0.25)
 
             return constructor(config, comm, process)
         except Exception:
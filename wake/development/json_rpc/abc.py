@@ -12,5 +12,5 @@ class ProtocolAbc(ABC):
         ...
 
     @abstractmethod
-    def send_recv(self, data: str) -> Any:
+    def send_recv(self, data: bytes) -> Any:
         ...
@@ -10,6 +10,7 @@ from wake.core import get_logger
 from .abc import ProtocolAbc
 from .http import HttpProtocol
 from .ipc import IpcProtocol
+from .serialization import encode
 from .websocket import WebsocketProtocol
 
 logger = get_logger(__name__)
@@ -58,11 +59,15 @@ class JsonRpcCommunicator:
             "params": params if params is not None else [],
             "id": self._request_id,
         }
-        logger.info(f"Sending request:\n{post_data}")
+        # avoid formatting log messages in the hot path when not logged
+        log = logger.isEnabledFor(logging.INFO)
+        if log:
+            logger.info(f"Sending request:\n{post_data}")
         self._request_id += 1
 
-        response = self._protocol.send_recv(json.dumps(post_data))
-        logger.info(f"Received response:\n{json.dumps(response)}")
+        response = self._protocol.send_recv(encode(post_data))
+        if log:
+            logger.info(f"Received response:\n{json.dumps(response)}")
         if "error" in response:
             raise JsonRpcError(response["error"])
         return response["result"]
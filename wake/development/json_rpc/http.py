@@ -1,9 +1,9 @@
-import json
 from urllib.request import Request, urlopen
 
 from wake.utils import get_package_version
 
 from .abc import ProtocolAbc
+from .serialization import decode
 
 
 class HttpProtocol(ProtocolAbc):
@@ -20,10 +20,10 @@ class HttpProtocol(ProtocolAbc):
     def __exit__(self, exc_type, exc_val, exc_tb):
         pass
 
-    def send_recv(self, data: str):
+    def send_recv(self, data: bytes):
         req = Request(
             self._uri,
-            data.encode("utf-8"),
+            data,
             headers={
                 "Content-Type": "application/json",
                 "User-Agent": f"wake/{get_package_version('eth-wake')}",
@@ -31,4 +31,4 @@ class HttpProtocol(ProtocolAbc):
         )
 
         with urlopen(req, timeout=self._timeout) as response:
-            return json.loads(response.read().decode("utf-8"))
+            return decode(response.read())
@@ -3,6 +3,7 @@ import platform
 import time
 
 from .abc import ProtocolAbc
+from .serialization import decode
 
 if platform.system() == "Windows":
     import win32file  # pyright: ignore reportMissingModuleSource
@@ -29,10 +30,10 @@ if platform.system() == "Windows":
         def __exit__(self, exc_type, exc_val, exc_tb):
             self._handle.close()
 
-        def send_recv(self, data: str):
+        def send_recv(self, data: bytes):
             win32file.WriteFile(
                 self._handle,  # pyright: ignore reportGeneralTypeIssues
-                data.encode("utf-8"),
+                data,
             )
             received = bytearray()
             start = time.perf_counter()
@@ -45,7 +46,7 @@ if platform.system() == "Windows":
                 if not received.rstrip().endswith((b"}", b"]")):
                     continue
                 try:
-                    return json.loads(received.decode("utf-8"))
+                    return decode(received)
                 except json.JSONDecodeError:
                     continue
             raise TimeoutError("IPC communication timeout")
@@ -70,8 +71,8 @@ else:
         def __exit__(self, exc_type, exc_val, exc_tb):
             self._socket.close()
 
-        def send_recv(self, data: str):
-            self._socket.sendall(data.encode("utf-8"))
+        def send_recv(self, data: bytes):
+            self._socket.sendall(data)
             received = bytearray()
             start = time.perf_counter()
 
@@ -82,7 +83,7 @@ else:
                     if not received.rstrip().endswith((b"}", b"]")):
                         continue
                     try:
-                        return json.loads(received.decode("utf-8"))
+                        return decode(received)
                     except json.JSONDecodeError:
                         continue
             raise TimeoutError("IPC communication timeout")
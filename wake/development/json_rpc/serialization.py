@@ -0,0 +1,23 @@
+import json
+import re
+from typing import Any, Union
+
+import orjson
+
+# orjson supports only 64-bit integers, larger ones (e.g. uint256 values) are parsed as floats
+# 19 digits already cover integers below the signed 64-bit range
+_BIG_INT_RE = re.compile(rb"[\[:,]\s*-?\d{19,}")
+
+
+def encode(data: Any) -> bytes:
+    try:
+        return orjson.dumps(data)
+    except TypeError:
+        # integers out of the 64-bit range
+        return json.dumps(data).encode("utf-8")
+
+
+def decode(data: Union[bytes, bytearray]) -> Any:
+    if _BIG_INT_RE.search(data) is not None:
+        return json.loads(data)
+    return orjson.loads(data)
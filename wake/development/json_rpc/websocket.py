@@ -1,8 +1,7 @@
-import json
-
-from websocket import WebSocket, create_connection
+from websocket import ABNF, WebSocket, create_connection
 
 from .abc import ProtocolAbc
+from .serialization import decode
 
 
 class WebsocketProtocol(ProtocolAbc):
@@ -22,6 +21,8 @@ class WebsocketProtocol(ProtocolAbc):
     def __exit__(self, exc_type, exc_val, exc_tb):
         self._ws.close()
 
-    def send_recv(self, data: str):
-        self._ws.send(data)  # pyright: ignore reportGeneralTypeIssues
-        return json.loads(self._ws.recv())
+    def send_recv(self, data: bytes):
+        # send already encoded data as a text frame and parse the raw payload without decoding it first
+        self._ws.send(data, ABNF.OPCODE_TEXT)  # pyright: ignore reportGeneralTypeIssues
+        _, payload = self._ws.recv_data()
+        return decode(payload)
@@ -43,6 +43,7 @@ from ..compiler.build_data_model import (
     ProjectBuild,
     ProjectBuildInfo,
     SourceUnitInfo,
+    SourceUnitsInfo,
 )
 from ..core.lsp_provider import LspProvider
 from ..core.solidity_version import SolidityVersionRange, SolidityVersionRanges
@@ -51,6 +52,8 @@ from ..detectors.api import DetectorConfidence, DetectorImpact, detect
 from ..printers.api import run_printers
 from ..utils import StrEnum, get_package_version
 from ..utils.file_utils import is_relative_to
+from ..utils.hashing import CONTENT_HASH_ALGO
+from ..utils.interval_index import FrozenIntervalIndex
 from .exceptions import LspError
 from .logging_handler import LspLoggingHandler
 from .lsp_data_model import LspModel
@@ -215,9 +218,9 @@ class LspCompiler:
     __output_contents: Dict[Path, VersionedFile]
     __compilation_errors: Dict[Path, Set[Diagnostic]]
     __last_successful_compilation_contents: Dict[Path, VersionedFile]
-    __interval_trees: Dict[Path, IntervalTree]
+    __interval_trees: Dict[Path, FrozenIntervalIndex]
     __source_units: Dict[Path, SourceUnit]
-    __last_compilation_interval_trees: Dict[Path, IntervalTree]
+    __last_compilation_interval_trees: Dict[Path, FrozenIntervalIndex]
     __last_compilation_source_units: Dict[Path, SourceUnit]
     __last_graph: nx.DiGraph
     __last_build_settings: SolcInputSettings
@@ -302,7 +305,7 @@ class LspCompiler:
         return self.__ir_reference_resolver
 
     @property
-    def interval_trees(self) -> Dict[Path, IntervalTree]:
+    def interval_trees(self) -> Dict[Path, FrozenIntervalIndex]:
         return self.__interval_trees
 
     @property
@@ -339,13 +342,17 @@ class LspCompiler:
                 cu_hash.hex(): CompilationUnitBuildInfo(errors=list(errors))
                 for cu_hash, errors in self.__latest_errors_per_cu.items()
             },
-            source_units_info={
-                node: SourceUnitInfo(
-                    fs_path=self.__last_graph.nodes[node]["path"],
-                    blake2b_hash=self.__last_graph.nodes[node]["hash"],
-                )
-                for node in self.__last_graph
-            },
+            source_units_info=SourceUnitsInfo.from_infos(
+                {
+                    node: SourceUnitInfo(
+                        fs_path=self.__last_graph.nodes[node]["path"],
+                        content_hash=self.__last_graph.nodes[node]["hash"],
+                        size=self.__last_graph.nodes[node]["size"],
+                        mtime_ns=self.__last_graph.nodes[node]["mtime_ns"],
+                    )
+                    for node in self.__last_graph
+                }
+            ),
             allow_paths=self.__config.compiler.solc.allow_paths,
             exclude_paths=self.__config.compiler.solc.exclude_paths,
             include_paths=self.__config.compiler.solc.include_paths,
@@ -353,10 +360,11 @@ class LspCompiler:
             target_solidity_version=self.__config.compiler.solc.target_version,
             wake_version=self.__wake_version,
             incremental=True,
+            hash_algo=CONTENT_HASH_ALGO,
         )
 
     @property
-    def last_compilation_interval_trees(self) -> Dict[Path, IntervalTree]:
+    def last_compilation_interval_trees(self) -> Dict[Path, FrozenIntervalIndex]:
         return self.__last_compilation_interval_trees
 
     @property
@@ -1065,7 +1073,7 @@ class LspCompiler:
                     None,
                 )
                 self.__source_units[path] = SourceUnit(init, ast)
-                self.__interval_trees[path] = interval_tree
+                self.__interval_trees[path] = FrozenIntervalIndex(interval_tree)
 
                 self.__last_compilation_source_units[path] = self.__source_units[path]
                 self.__last_compilation_interval_trees[path] = self.__interval_trees[
@@ -3,13 +3,12 @@ from collections import defaultdict
 from pathlib import Path
 from typing import DefaultDict, Dict, List, Optional, Tuple, Union
 
-from Crypto.Hash import BLAKE2b
-
 from wake.core.solidity_version import (
     SolidityVersionExpr,
     SolidityVersionRange,
     SolidityVersionRanges,
 )
+from wake.utils.hashing import content_hash
 
 from .solidity_import import SolidityImportExpr
 
@@ -246,7 +245,10 @@ class SoliditySourceParser:
 
     @classmethod
     def parse(
-        cls, path: Path, ignore_errors: bool = False
+        cls,
+        path: Path,
+        ignore_errors: bool = False,
+        cached_hash: Optional[bytes] = None,
     ) -> Tuple[
         SolidityVersionRanges,
         List[str],
@@ -257,9 +259,10 @@ class SoliditySourceParser:
         """
         Return a tuple of two lists. The first list contains Solidity version ranges that can be used to compile
         the given file. The second list contains filenames / URLs that are imported from the given file.
+        If `cached_hash` is given, it is returned instead of hashing the file contents.
         """
         raw_content = path.read_bytes()
-        h = BLAKE2b.new(data=raw_content, digest_bits=256)
+        h = cached_hash if cached_hash is not None else content_hash(raw_content)
 
         # strip all comments, parse wake comments
         stripped_content = bytearray(raw_content)
@@ -268,7 +271,7 @@ class SoliditySourceParser:
         return (
             cls._parse_version_pragma(stripped_content, ignore_errors),
             cls._parse_import(stripped_content, ignore_errors),
-            h.digest(),
+            h,
             raw_content,
             wake_comments,
         )
@@ -288,7 +291,7 @@ class SoliditySourceParser:
         Return a tuple of two lists. The first list contains Solidity version ranges that can be used to compile
         the given file. The second list contains filenames / URLs that are imported from the given file.
         """
-        h = BLAKE2b.new(data=source_code, digest_bits=256)
+        h = content_hash(source_code)
 
         # strip all comments, parse wake comments
         stripped_source_code = bytearray(source_code)
@@ -297,6 +300,6 @@ class SoliditySourceParser:
         return (
             cls._parse_version_pragma(stripped_source_code, ignore_errors),
             cls._parse_import(stripped_source_code, ignore_errors),
-            h.digest(),
+            h,
             wake_comments,
         )
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import copy
-import json
 import logging
 import pathlib
 import re
@@ -11,7 +10,7 @@ from dataclasses import asdict, dataclass, field
 from itertools import chain
 from typing import Any, Callable, DefaultDict, Dict, List, Optional, Set, Tuple, Union
 
-from intervaltree import IntervalTree
+import orjson
 
 from wake.cli.console import console
 from wake.compiler import SolidityCompiler
@@ -47,6 +46,7 @@ from wake.ir import (
     YulSwitch,
 )
 from wake.ir.reference_resolver import ReferenceResolver
+from wake.utils.interval_index import FrozenIntervalIndex
 
 logger = get_logger(__name__, logging.ERROR)
 
@@ -326,8 +326,8 @@ def write_coverage(
     coverage: Dict[str, List[Dict[str, List]]], coverage_file: pathlib.Path
 ):
     data = CoverageFileData(data=coverage)
-    with open(coverage_file, "w") as f:
-        json.dump(asdict(data), f, indent=4)
+    with open(coverage_file, "wb") as f:
+        f.write(orjson.dumps(asdict(data), option=orjson.OPT_INDENT_2))
 
 
 def returning_none():
@@ -337,7 +337,7 @@ def returning_none():
 class CoverageHandler:
     _pc_maps: Dict[str, Dict[int, SourceMapPcRecord]]
     _pc_maps_undeployed: Dict[str, Dict[int, SourceMapPcRecord]]
-    _interval_trees: Dict[pathlib.Path, IntervalTree]
+    _interval_trees: Dict[pathlib.Path, FrozenIntervalIndex]
     _lines_index: Dict[pathlib.Path, List[Tuple[bytes, int]]]
     _statement_coverage: DefaultDict[Union[StatementAbc, YulStatementAbc], int]
     _function_coverage: DefaultDict[FunctionDefinition, int]
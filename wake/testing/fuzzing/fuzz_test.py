@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from typing import Callable, DefaultDict, List, Optional
+from typing import Any, Callable, DefaultDict, Dict, List, Optional
 
 from typing_extensions import get_type_hints
 
@@ -71,6 +71,16 @@ class FuzzTest:
         flows: List[Callable] = self.__get_methods("flow")
         invariants: List[Callable] = self.__get_methods("invariant")
 
+        # resolve flow parameter types once, get_type_hints is expensive
+        flows_params_types: Dict[Callable, List[Any]] = {
+            f: [
+                v
+                for k, v in get_type_hints(f, include_extras=True).items()
+                if k != "return"
+            ]
+            for f in flows
+        }
+
         for i in range(sequences_count):
             flows_counter: DefaultDict[Callable, int] = defaultdict(int)
             invariant_periods: DefaultDict[Callable[[None], None], int] = defaultdict(
@@ -113,11 +123,7 @@ class FuzzTest:
                         f"Could not find a valid flow to run.\nFlows that have reached their max_times: {max_times_flows}\nFlows that do not satisfy their precondition: {precondition_flows}"
                     )
                 flow = random.choices(valid_flows, weights=weights)[0]
-                flow_params = [
-                    generate(v)
-                    for k, v in get_type_hints(flow, include_extras=True).items()
-                    if k != "return"
-                ]
+                flow_params = [generate(v) for v in flows_params_types[flow]]
 
                 self._flow_num = j
                 self.pre_flow(flow)
@@ -6,13 +6,16 @@ import os
 import pickle
 import sys
 import time
+import traceback
 import types
+from collections import Counter
 from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional, Type
+from typing import Any, Callable, Dict, Iterable, List, Optional, Type, Union
 
 import rich.progress
 from pathvalidate import sanitize_filename  # type: ignore
+from rich.syntax import Syntax
 from rich.traceback import Traceback
 from tblib import pickling_support
 
@@ -21,9 +24,12 @@ from wake.config import WakeConfig
 from wake.development.globals import (
     attach_debugger,
     chain_interfaces_manager,
+    get_verbosity,
     random,
+    set_config,
     set_coverage_handler,
     set_exception_handler,
+    set_verbosity,
 )
 from wake.testing.coverage import (
     CoverageHandler,
@@ -44,8 +50,18 @@ def _run(
     finished_event: multiprocessing.synchronize.Event,
     err_child_conn: multiprocessing.connection.Connection,
     cov_child_conn: multiprocessing.connection.Connection,
-    coverage: Optional[CoverageHandler],
+    coverage: Optional[Union[CoverageHandler, bytes]],
+    config: WakeConfig,
+    verbosity: int,
+    rich_traceback: bool,
 ):
+    # workers do not inherit globals of the parent process
+    set_config(config)
+    set_verbosity(verbosity)
+
+    if isinstance(coverage, bytes):
+        coverage = pickle.loads(coverage)
+
     def exception_handler(
         e_type: Optional[Type[BaseException]],
         e: Optional[BaseException],
@@ -62,11 +78,16 @@ def _run(
         nonlocal exception_handled
         exception_handled = True
 
-        try:
-            pickled = pickle.dumps((e_type, e, tb))
-        except Exception:
-            pickled = pickle.dumps((e_type, Exception(repr(e)), tb))
-        err_child_conn.send(pickled)
+        if rich_traceback:
+            try:
+                pickled = pickle.dumps((e_type, e, tb))
+            except Exception:
+                pickled = pickle.dumps((e_type, Exception(repr(e)), tb))
+            err_child_conn.send(("pickled", pickled))
+        else:
+            # formatting in the worker is much cheaper than pickling the whole traceback with tblib
+            formatted = "".join(traceback.format_exception(e_type, e, tb))
+            err_child_conn.send(("formatted", formatted.encode("utf-8")))
         finished_event.set()
 
         try:
@@ -89,7 +110,8 @@ def _run(
 
     ctx_managers = []
 
-    pickling_support.install()
+    if rich_traceback:
+        pickling_support.install()
     random.seed(random_seed)
 
     set_exception_handler(exception_handler)
@@ -137,15 +159,18 @@ def compute_coverage_per_function(
     ide_cov: Dict[str, List[Dict[str, Any]]]
 ) -> Dict[str, int]:
     funcs_cov = {}
-    fn_names = []
-    for path_rec in ide_cov.values():
-        fn_names.extend([rec["name"] for rec in path_rec if rec["coverageHits"] > 0])
+    name_counts = Counter(
+        rec["name"]
+        for path_rec in ide_cov.values()
+        for rec in path_rec
+        if rec["coverageHits"] > 0
+    )
 
     for fn_path, path_rec in ide_cov.items():
         for fn_rec in path_rec:
             if fn_rec["coverageHits"] == 0:
                 continue
-            if fn_names.count(fn_rec["name"]) > 1:
+            if name_counts[fn_rec["name"]] > 1:
                 funcs_cov[f"{fn_path}:{fn_rec['name']}"] = fn_rec["coverageHits"]
             else:
                 funcs_cov[fn_rec["name"]] = fn_rec["coverageHits"]
@@ -163,25 +188,49 @@ def fuzz(
     attach_first: bool,
     cov_proc_num: int,
     verbose_coverage: bool,
+    rich_traceback: bool = False,
+    forkserver: bool = False,
 ):
+    if forkserver and "forkserver" in multiprocessing.get_all_start_methods():
+        # workers are forked from a server process with the test module preloaded instead of the whole parent process
+        # the test module must be importable by its name
+        mp_context = multiprocessing.get_context("forkserver")
+        mp_context.set_forkserver_preload(
+            ["wake.testing", __name__, fuzz_test.__module__]
+        )
+    else:
+        mp_context = multiprocessing.get_context()
+
+    empty_coverage: Optional[Union[CoverageHandler, bytes]]
     if cov_proc_num != 0:
         empty_coverage = CoverageHandler(config)
+        if mp_context.get_start_method() != "fork":
+            # pickle once instead of once per process, forked processes share the handler without pickling
+            empty_coverage = pickle.dumps(
+                empty_coverage, protocol=pickle.HIGHEST_PROTOCOL
+            )
         # clear coverage file
         write_coverage({}, config.project_root_path / "wake-coverage.cov")
     else:
         empty_coverage = None
+
+    # only the process index differs between log file names
+    log_prefix = sanitize_filename(
+        f"{fuzz_test.__module__}.{func_name}",
+        max_len=255 - len(f"_{process_count - 1}.ansi"),
+    )
     processes = dict()
     for i, seed in zip(range(process_count), random_seeds):
         console.print(f"Using random seed '{seed.hex()}' for process #{i}")
-        finished_event = multiprocessing.Event()
-        err_parent_conn, err_child_con = multiprocessing.Pipe()
-        cov_parent_conn, cov_child_con = multiprocessing.Pipe()
+        finished_event = mp_context.Event()
+        err_parent_conn, err_child_con = mp_context.Pipe()
+        cov_parent_conn, cov_child_con = mp_context.Pipe(duplex=False)
 
-        log_path = logs_dir / sanitize_filename(
-            f"{fuzz_test.__module__}.{func_name}_{i}.ansi"
-        )
+        log_path = logs_dir / f"{log_prefix}_{i}.ansi"
+        # create (or truncate) the log file before the stdout and stderr tees open it in append mode
+        log_path.write_bytes(b"")
 
-        p = multiprocessing.Process(
+        p = mp_context.Process(
             target=_run,
             args=(
                 fuzz_test,
@@ -193,10 +242,15 @@ def fuzz(
                 err_child_con,
                 cov_child_con,
                 empty_coverage if i < cov_proc_num else None,
+                config,
+                get_verbosity(),
+                rich_traceback,
             ),
         )
         processes[i] = (p, finished_event, err_parent_conn, cov_parent_conn)
         p.start()
+        # the write end is owned by the child process now
+        cov_child_con.close()
 
     try:
         with rich.progress.Progress(
@@ -208,6 +262,9 @@ def fuzz(
             exported_coverages: Dict[
                 int, Dict[Path, Dict[IdePosition, IdeFunctionCoverageRecord]]
             ] = {}
+            last_res: Optional[Dict[str, List[Dict[str, List]]]] = None
+            last_export_ts = 0.0
+            coverage_changed = False
 
             if attach_first:
                 progress.stop()
@@ -219,20 +276,33 @@ def fuzz(
                 to_be_removed = []
                 for i, (p, e, err_parent_conn, cov_parent_conn) in processes.items():
                     finished = e.wait(0.125)
+                    # the process exited without reporting, e.g. killed or failed to start
+                    died = not finished and not p.is_alive() and not e.is_set()
+                    if died:
+                        to_be_removed.append(i)
+                        if not attach_first:
+                            progress.stop()
+                        console.print(
+                            f"Process #{i} exited unexpectedly with exit code {p.exitcode}."
+                        )
+                        if not attach_first or i == 0:
+                            progress.start()
+                        progress.update(
+                            task, thr_rem=len(processes) - len(to_be_removed)
+                        )
+
                     if finished:
                         to_be_removed.append(i)
 
                         exception_info = err_parent_conn.recv()
-                        if exception_info is not None:
-                            exception_info = pickle.loads(exception_info)
-
                         if exception_info is not None:
                             if not attach_first or i == 0:
-                                tb = Traceback.from_exception(
-                                    exception_info[0],
-                                    exception_info[1],
-                                    exception_info[2],
-                                )
+                                exception_format, exception_data = exception_info
+                                if exception_format == "pickled":
+                                    e_type, e_value, e_tb = pickle.loads(exception_data)
+                                    tb = Traceback.from_exception(e_type, e_value, e_tb)
+                                else:
+                                    tb = Syntax(exception_data.decode("utf-8"), "pytb")
 
                                 if not attach_first:
                                     progress.stop()
@@ -274,27 +344,37 @@ def fuzz(
                             break
                     if tmp is not None:
                         exported_coverages[i] = tmp
+                        coverage_changed = True
+
+                    # debounce coverage export, always flush when a process finishes or dies
+                    if coverage_changed and (
+                        finished or died or time.monotonic() - last_export_ts > 0.5
+                    ):
+                        coverage_changed = False
+                        last_export_ts = time.monotonic()
                         res = export_merged_ide_coverage(
                             list(exported_coverages.values())
                         )
-                        if res:
-                            write_coverage(
-                                res, config.project_root_path / "wake-coverage.cov"
-                            )
-                        cov_info = ""
-                        if not attach_first and verbose_coverage:
-                            cov_info = "\n[dark_goldenrod]" + "\n".join(
-                                [
-                                    f"{fn_name}: [green]{fn_calls}[dark_goldenrod]"
-                                    for (fn_name, fn_calls) in sorted(
-                                        compute_coverage_per_function(res).items(),
-                                        key=lambda x: x[1],
-                                        reverse=True,
-                                    )
-                                ]
-                            )
-                        progress.update(task, coverage_info=cov_info)
-                    if finished:
+                        if res != last_res:
+                            last_res = res
+                            if res:
+                                write_coverage(
+                                    res, config.project_root_path / "wake-coverage.cov"
+                                )
+                            cov_info = ""
+                            if not attach_first and verbose_coverage:
+                                cov_info = "\n[dark_goldenrod]" + "\n".join(
+                                    [
+                                        f"{fn_name}: [green]{fn_calls}[dark_goldenrod]"
+                                        for (fn_name, fn_calls) in sorted(
+                                            compute_coverage_per_function(res).items(),
+                                            key=lambda x: x[1],
+                                            reverse=True,
+                                        )
+                                    ]
+                                )
+                            progress.update(task, coverage_info=cov_info)
+                    if finished or died:
                         cov_parent_conn.close()
 
                 for i in to_be_removed:
@@ -0,0 +1,27 @@
+from typing_extensions import Literal
+
+try:
+    import xxhash
+
+    CONTENT_HASH_ALGO: Literal["blake2b", "xxh3_128"] = "xxh3_128"
+    CONTENT_HASH_SIZE = 16
+
+    def content_hash(data: bytes) -> bytes:
+        """
+        Return a non-cryptographic 128-bit xxh3 hash of the given data.
+        Used as a cache key for incremental compilation.
+        """
+        return xxhash.xxh3_128(data).digest()
+
+except ImportError:
+    from Crypto.Hash import BLAKE2b
+
+    CONTENT_HASH_ALGO: Literal["blake2b", "xxh3_128"] = "blake2b"
+    CONTENT_HASH_SIZE = 32
+
+    def content_hash(data: bytes) -> bytes:
+        """
+        Return a 256-bit blake2b hash of the given data.
+        Fallback used when `xxhash` is not installed.
+        """
+        return BLAKE2b.new(data=data, digest_bits=256).digest()
@@ -0,0 +1,122 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator, List, Optional, Set, Union
+
+from intervaltree import Interval
+
+
+class FrozenIntervalIndex:
+    """
+    Immutable interval index with the read-only query API of [IntervalTree](https://github.com/chaimleib/intervaltree).
+    Intervals are stored sorted by their begin offsets. For every interval, the index of the nearest preceding
+    interval with a greater end offset is precomputed, so that queries are answered by binary search and a backward
+    scan that skips whole groups of intervals ending too early (e.g. already closed sibling AST subtrees).
+    Intervals are half-open, i.e. `[begin, end)`, same as in `IntervalTree`.
+    """
+
+    __slots__ = ("_intervals", "_begins", "_ends", "_prev_greater", "_max_end")
+
+    _intervals: List[Interval]
+    _begins: array
+    _ends: array
+    _prev_greater: array
+    _max_end: int
+
+    def __init__(self, intervals: Iterable[Interval] = ()):
+        self._intervals = sorted(intervals, key=lambda iv: (iv.begin, iv.end))
+        self._begins = array("q", (iv.begin for iv in self._intervals))
+        self._ends = array("q", (iv.end for iv in self._intervals))
+        self._prev_greater = array("q")
+        self._max_end = max(self._ends) if len(self._ends) > 0 else 0
+
+        # monotonic stack of indexes with decreasing end offsets
+        stack: List[int] = []
+        for i, end in enumerate(self._ends):
+            while len(stack) > 0 and self._ends[stack[-1]] <= end:
+                stack.pop()
+            self._prev_greater.append(stack[-1] if len(stack) > 0 else -1)
+            stack.append(i)
+
+    def __getstate__(self):
+        return self._intervals
+
+    def __setstate__(self, state):
+        self.__init__(state)
+
+    def __len__(self) -> int:
+        return len(self._intervals)
+
+    def __iter__(self) -> Iterator[Interval]:
+        return iter(self._intervals)
+
+    def __contains__(self, interval: Interval) -> bool:
+        return interval in self.envelop(interval.begin, interval.end)
+
+    def __getitem__(self, index: Union[int, slice]) -> Set[Interval]:
+        if isinstance(index, slice):
+            start, stop = index.start, index.stop
+            if start is None:
+                if stop is None:
+                    return set(self._intervals)
+                start = self.begin()
+            if stop is None:
+                stop = self.end()
+            return self.overlap(start, stop)
+        return self.at(index)
+
+    def is_empty(self) -> bool:
+        return len(self._intervals) == 0
+
+    def items(self) -> Set[Interval]:
+        return set(self._intervals)
+
+    def begin(self) -> int:
+        return self._begins[0] if len(self._begins) > 0 else 0
+
+    def end(self) -> int:
+        return self._max_end
+
+    def _scan(self, k: int, point: int) -> Set[Interval]:
+        # collect intervals with index <= k ending after point
+        # intervals between k and its previous greater end cannot end after point if k does not
+        result = set()
+        while k >= 0:
+            if self._ends[k] > point:
+                result.add(self._intervals[k])
+                k -= 1
+            else:
+                k = self._prev_greater[k]
+        return result
+
+    def at(self, p: int) -> Set[Interval]:
+        """
+        Returns:
+            Set of all intervals that contain the point `p`.
+        """
+        return self._scan(bisect_right(self._begins, p) - 1, p)
+
+    def overlap(self, begin: int, end: Optional[int] = None) -> Set[Interval]:
+        """
+        Returns:
+            Set of all intervals overlapping the range `[begin, end)`.
+        """
+        if end is None:
+            iv: Interval = begin  # pyright: ignore reportGeneralTypeIssues
+            return self.overlap(iv.begin, iv.end)
+        if begin >= end:
+            return set()
+        return self._scan(bisect_left(self._begins, end) - 1, begin)
+
+    def envelop(self, begin: int, end: Optional[int] = None) -> Set[Interval]:
+        """
+        Returns:
+            Set of all intervals fully contained in the range `[begin, end)`.
+        """
+        if end is None:
+            iv: Interval = begin  # pyright: ignore reportGeneralTypeIssues
+            return self.envelop(iv.begin, iv.end)
+        if begin >= end:
+            return set()
+        lo = bisect_left(self._begins, begin)
+        hi = bisect_left(self._begins, end)
+        return {iv for iv in self._intervals[lo:hi] if iv.end <= end}